@@ -18,6 +18,8 @@ __all__         = [
     "CityHash64WithSeeds",
     "CityHash128",
     "CityHash128WithSeed",
+    "FingerprintCache",
+    "memoize",
 ]
 
 
@@ -75,6 +77,12 @@ from cpython.bytes cimport PyBytes_Check
 from cpython.bytes cimport PyBytes_GET_SIZE
 from cpython.bytes cimport PyBytes_AS_STRING
 
+from collections import OrderedDict, namedtuple
+from functools import update_wrapper
+from sys import getsizeof
+from types import MethodType
+from weakref import finalize, ref
+
 
 cdef object _type_error(argname: str, expected: object, value: object):
     return TypeError(
@@ -268,3 +276,284 @@ def CityHash128WithSeed(data, seed: int = 0L) -> int:
     first = <object>PyLong_FromUnsignedLongLong(result.first)
     second = <object>PyLong_FromUnsignedLongLong(result.second)
     return (first << 64ULL) + second
+
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "maxsize", "currsize", "maxbytes", "currbytes"]
+)
+
+
+_SCALAR_TYPES = (type(None), bool, int, float)
+
+
+cdef object _argument_key(object key, object arg, object name):
+    # Fingerprints alone would let equal bytes of different types or buffer
+    # layouts (e.g. b"abc" and "abc", or int8 and int64 arrays) share an
+    # entry, so the type, and for buffers the format and shape, are kept too.
+    cls = type(arg)
+    if cls in _SCALAR_TYPES:
+        return (cls, arg)
+    try:
+        if cls is bytes or cls is str:
+            return (cls, key(arg))
+        if PyObject_CheckBuffer(arg):
+            with memoryview(arg) as view:
+                return (cls, view.format, view.shape, key(arg))
+        return (cls, key(arg))
+    except TypeError:
+        raise TypeError(
+            "Argument %s has incorrect type: cannot fingerprint '%s' with %s" %
+            (name, cls.__name__, getattr(key, "__name__", repr(key)))
+        ) from None
+    except (BufferError, ValueError) as exc:
+        raise type(exc)(
+            "Argument %s cannot be fingerprinted: %s" % (name, exc)
+        ) from None
+
+
+cdef object _check_limit(argname: str, value: object):
+    if value is None:
+        return
+    if not isinstance(value, int):
+        raise _type_error(argname, ["int", "None"], value)
+    if value < 0:
+        raise ValueError("Argument '%s' must be non-negative" % argname)
+
+
+def _forget_instance(cache_ref, instance_id):
+    cache = cache_ref()
+    if cache is not None:
+        cache._forget(instance_id)
+
+
+class FingerprintCache(object):
+    """Memoizing wrapper keyed by fingerprints of call arguments.
+
+    Only the fingerprints are retained as keys, so large argument payloads
+    are neither kept alive by the cache nor compared on lookup. Strings,
+    bytes, and buffer objects are fingerprinted with ``key`` together with
+    their type (and, for buffers, their format and shape); ``None``,
+    booleans, integers, and floats are used as keys directly. Buffers must
+    be C-contiguous.
+
+    When the cache is defined as a method in a class body, or when the first
+    argument is a class (as with ``classmethod`` stacked over the cache), the
+    first argument is keyed by identity rather than by equality. The entries
+    for an instance are dropped once it is garbage-collected. Instances that
+    do not support weak references are instead kept alive for as long as
+    they have entries in the cache.
+
+    :param func: function to memoize
+    :param maxsize: maximum number of entries to keep (``None`` for no limit)
+    :param maxbytes: maximum total size of cached results as measured by
+        ``getsize`` (``None`` for no limit)
+    :param key: function mapping each argument to a fingerprint
+        (defaults to ``CityHash128``)
+    :param getsize: function measuring the size of a result in bytes
+        (defaults to ``sys.getsizeof``)
+    :raises TypeError: if maxsize or maxbytes is not an integer or None
+    :raises ValueError: if maxsize or maxbytes is negative
+    """
+
+    def __init__(self, func, maxsize=128, maxbytes=None, key=CityHash128,
+                 getsize=getsizeof):
+        _check_limit("maxsize", maxsize)
+        _check_limit("maxbytes", maxbytes)
+        self._func = func
+        self._maxsize = maxsize
+        self._maxbytes = maxbytes
+        self._key = key
+        self._getsize = getsize
+        self._method = False
+        self._instance_name = None
+        self._cache = OrderedDict()
+        # instance id -> (finalizer or the instance itself, fingerprints)
+        self._instances = {}
+        self._hits = 0
+        self._misses = 0
+        self._currbytes = 0
+        update_wrapper(self, func)
+
+    def __set_name__(self, owner, name):
+        self._method = True
+        code = getattr(self._func, "__code__", None)
+        if code is not None and code.co_argcount:
+            self._instance_name = code.co_varnames[0]
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return MethodType(self, obj)
+
+    def _make_key(self, args, kwargs, instance):
+        key = self._key
+        skip = None
+        if instance is None:
+            fingerprint = []
+            start = 0
+        else:
+            # A bare integer cannot collide with the tuples used for other
+            # arguments.
+            fingerprint = [id(instance)]
+            if args:
+                start = 1
+            else:
+                start = 0
+                skip = self._instance_name
+        for pos in range(start, len(args)):
+            fingerprint.append(
+                _argument_key(key, args[pos], "at position %d" % pos)
+            )
+        if kwargs:
+            for name in sorted(kwargs):
+                if name == skip:
+                    continue
+                fingerprint.append(
+                    (name, _argument_key(key, kwargs[name], "'%s'" % name))
+                )
+        return tuple(fingerprint)
+
+    def _track(self, instance, fingerprint):
+        instance_id = id(instance)
+        record = self._instances.get(instance_id)
+        if record is None:
+            try:
+                anchor = finalize(instance, _forget_instance, ref(self), instance_id)
+                anchor.atexit = False
+            except TypeError:
+                anchor = instance
+            record = self._instances[instance_id] = (anchor, set())
+        record[1].add(fingerprint)
+
+    def _untrack(self, instance_id, fingerprint):
+        record = self._instances.get(instance_id)
+        if record is None:
+            return
+        record[1].discard(fingerprint)
+        if not record[1]:
+            del self._instances[instance_id]
+            if isinstance(record[0], finalize):
+                record[0].detach()
+
+    def _forget(self, instance_id):
+        record = self._instances.pop(instance_id, None)
+        if record is None:
+            return
+        for fingerprint in record[1]:
+            entry = self._cache.pop(fingerprint, None)
+            if entry is not None:
+                self._currbytes -= entry[1]
+
+    def _discard(self, fingerprint):
+        entry = self._cache.pop(fingerprint, None)
+        if entry is not None:
+            self._currbytes -= entry[1]
+            if entry[2] is not None:
+                self._untrack(entry[2], fingerprint)
+
+    def __call__(self, /, *args, **kwargs):
+        maxsize = self._maxsize
+        maxbytes = self._maxbytes
+        if maxsize == 0 or maxbytes == 0:
+            self._misses += 1
+            return self._func(*args, **kwargs)
+        instance = None
+        if args:
+            if self._method or isinstance(args[0], type):
+                instance = args[0]
+        elif self._method and self._instance_name in kwargs:
+            instance = kwargs[self._instance_name]
+        cache = self._cache
+        fingerprint = self._make_key(args, kwargs, instance)
+        try:
+            entry = cache[fingerprint]
+        except KeyError:
+            pass
+        else:
+            cache.move_to_end(fingerprint)
+            self._hits += 1
+            return entry[0]
+        self._misses += 1
+        result = self._func(*args, **kwargs)
+        size = 0 if maxbytes is None else self._getsize(result)
+        if maxbytes is not None and size > maxbytes:
+            return result
+        self._discard(fingerprint)
+        if instance is None:
+            cache[fingerprint] = (result, size, None)
+        else:
+            cache[fingerprint] = (result, size, fingerprint[0])
+            self._track(instance, fingerprint)
+        self._currbytes += size
+        while (
+            (maxsize is not None and len(cache) > maxsize) or
+            (maxbytes is not None and self._currbytes > maxbytes)
+        ):
+            fingerprint, entry = cache.popitem(last=False)
+            self._currbytes -= entry[1]
+            if entry[2] is not None:
+                self._untrack(entry[2], fingerprint)
+        return result
+
+    def cache_info(self):
+        """Report cache statistics.
+
+        :return: a named tuple of (hits, misses, maxsize, currsize, maxbytes,
+            currbytes)
+        """
+        return CacheInfo(
+            self._hits, self._misses, self._maxsize, len(self._cache),
+            self._maxbytes, self._currbytes,
+        )
+
+    def cache_clear(self):
+        """Clear the cache and its statistics."""
+        for anchor, _ in self._instances.values():
+            if isinstance(anchor, finalize):
+                anchor.detach()
+        self._instances.clear()
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
+        self._currbytes = 0
+
+
+def memoize(maxsize=128, maxbytes=None, key=CityHash128, getsize=getsizeof):
+    """Memoize a function, keying entries by fingerprints of its arguments.
+
+    Unlike ``functools.lru_cache``, payload arguments are not stored in the
+    cache; each one is reduced to a fingerprint with ``key``, which makes the
+    decorator suitable for functions taking large byte payloads. Arguments
+    must be strings, bytes, C-contiguous buffer objects, ``None``, booleans,
+    integers, or floats, unless a custom ``key`` accepts other types.
+    Arguments of different types never share an entry, even if their bytes
+    are equal. Least recently used entries are evicted once either limit is
+    exceeded. See ``FingerprintCache`` for details, including how methods
+    are handled.
+
+    >>> @memoize(maxsize=2)
+    ... def size(data):
+    ...     return len(data)
+    >>> size(b"abc"), size(b"abc"), size(bytearray(b"abc"))
+    (3, 3, 3)
+    >>> size.cache_info()
+    CacheInfo(hits=1, misses=2, maxsize=2, currsize=2, maxbytes=None, currbytes=0)
+
+    :param maxsize: maximum number of entries to keep (``None`` for no limit)
+    :param maxbytes: maximum total size of cached results as measured by
+        ``getsize`` (``None`` for no limit)
+    :param key: function mapping each argument to a fingerprint
+        (defaults to ``CityHash128``)
+    :param getsize: function measuring the size of a result in bytes
+        (defaults to ``sys.getsizeof``)
+    :return: a decorator wrapping a function in a ``FingerprintCache``
+    :raises TypeError: if maxsize or maxbytes is not an integer or None
+    :raises ValueError: if maxsize or maxbytes is negative
+    """
+    _check_limit("maxsize", maxsize)
+    _check_limit("maxbytes", maxbytes)
+
+    def decorator(func):
+        return FingerprintCache(func, maxsize, maxbytes, key, getsize)
+
+    return decorator
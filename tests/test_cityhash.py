@@ -1,10 +1,13 @@
 """
 Python-based tests for cityhash extension
 """
+import array
+import gc
 import random
 import string
 import sys
 import unittest
+import weakref
 
 from cityhash import (
     CityHash32,
@@ -13,6 +16,8 @@ from cityhash import (
     CityHash64WithSeeds,
     CityHash128,
     CityHash128WithSeed,
+    FingerprintCache,
+    memoize,
 )
 
 
@@ -176,3 +181,370 @@ class TestProperties(unittest.TestCase):
         for func in funcs:
             with self.assertRaises(TypeError):
                 func([])
+
+
+class TestMemoize(unittest.TestCase):
+
+    """test fingerprint-keyed memoization"""
+
+    def test_hits_by_type(self):
+        """Equal payloads share an entry only if their types match"""
+        calls = []
+
+        @memoize()
+        def func(data):
+            calls.append(data)
+            return data
+
+        self.assertEqual(func(b"abc"), b"abc")
+        self.assertEqual(func(b"abc"), b"abc")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(func("abc"), "abc")
+        self.assertEqual(func(bytearray(b"abc")), bytearray(b"abc"))
+        self.assertIsInstance(func(memoryview(b"abc")), memoryview)
+        self.assertEqual(len(calls), 4)
+        self.assertEqual(func.cache_info()[:4], (1, 4, 128, 4))
+
+    def test_buffer_layout(self):
+        """Equal bytes with different buffer formats or shapes do not collide"""
+
+        @memoize()
+        def func(data):
+            return len(data)
+
+        payload = b"\x00" * 8
+        self.assertEqual(func(memoryview(payload)), 8)
+        self.assertEqual(func(memoryview(payload).cast("q")), 1)
+        self.assertEqual(func(memoryview(payload).cast("B", (2, 4))), 2)
+        self.assertEqual(func(array.array("b", payload)), 8)
+        self.assertEqual(func(array.array("q", [0])), 1)
+        self.assertEqual(func.cache_info().hits, 0)
+
+    def test_scalar_arguments(self):
+        """Small scalars are used as keys directly"""
+
+        @memoize()
+        def func(data, count, flag=None):
+            return data * int(count)
+
+        self.assertEqual(func(b"a", 2), b"aa")
+        self.assertEqual(func(b"a", 2), b"aa")
+        self.assertEqual(func(b"a", 2.0), b"aa")
+        self.assertEqual(func(b"a", 2, flag=True), b"aa")
+        self.assertEqual(func(b"a", 3), b"aaa")
+        self.assertEqual(func.cache_info()[:2], (1, 4))
+
+    def test_keyword_arguments(self):
+        """Keyword names and values both contribute to the key"""
+
+        @memoize()
+        def func(data, suffix=b""):
+            return data + suffix
+
+        self.assertEqual(func(b"a", suffix=b"b"), b"ab")
+        self.assertEqual(func(b"a", suffix=b"c"), b"ac")
+        self.assertEqual(func(b"a"), b"a")
+        self.assertEqual(func.cache_info().currsize, 3)
+
+    def test_lru_eviction(self):
+        """Least recently used entry is evicted first"""
+
+        @memoize(maxsize=2)
+        def func(data):
+            return data
+
+        func(b"a")
+        func(b"b")
+        func(b"a")
+        func(b"c")
+        self.assertEqual(func.cache_info()[:4], (1, 3, 2, 2))
+        func(b"a")
+        self.assertEqual(func.cache_info().hits, 2)
+        func(b"b")
+        self.assertEqual(func.cache_info().misses, 4)
+
+    def test_maxbytes_eviction(self):
+        """Least recently used entries are evicted until results fit"""
+
+        @memoize(maxsize=None, maxbytes=10, getsize=len)
+        def func(data):
+            return data * 4
+
+        func(b"a")
+        func(b"b")
+        self.assertEqual(func.cache_info()[3:], (2, 10, 8))
+        func(b"a")
+        func(b"c")
+        self.assertEqual(func.cache_info()[3:], (2, 10, 8))
+        func(b"a")
+        self.assertEqual(func.cache_info().hits, 2)
+        func(b"b")
+        self.assertEqual(func.cache_info().misses, 4)
+
+    def test_maxbytes_oversized_result(self):
+        """Results larger than maxbytes are returned but not cached"""
+
+        @memoize(maxbytes=10, getsize=len)
+        def func(data):
+            return data * 20
+
+        func(b"a")
+        self.assertEqual(func(b"a"), b"a" * 20)
+        self.assertEqual(func.cache_info()[:4], (0, 2, 128, 0))
+        self.assertEqual(func.cache_info().currbytes, 0)
+
+    def test_maxbytes_default_getsize(self):
+        """Result sizes default to sys.getsizeof"""
+
+        @memoize(maxbytes=1 << 20)
+        def func(data):
+            return bytes(data)
+
+        func(b"abc")
+        self.assertEqual(func.cache_info().currbytes, sys.getsizeof(b"abc"))
+
+    def test_maxsize_zero(self):
+        """Zero maxsize disables caching"""
+
+        @memoize(maxsize=0)
+        def func(data):
+            return data
+
+        func(b"a")
+        func(b"a")
+        self.assertEqual(func.cache_info()[:4], (0, 2, 0, 0))
+
+    def test_cache_clear(self):
+        """Clearing resets entries and statistics"""
+
+        @memoize(maxsize=None, maxbytes=100, getsize=len)
+        def func(data):
+            return data
+
+        func(b"a")
+        func(b"a")
+        func.cache_clear()
+        self.assertEqual(func.cache_info(), (0, 0, None, 0, 100, 0))
+
+    def test_does_not_retain_arguments(self):
+        """Cache holds no references to the arguments"""
+
+        @memoize()
+        def func(data):
+            return len(data)
+
+        arg = bytearray(b"abc")
+        old_refcount = sys.getrefcount(arg)
+        func(arg)
+        func(arg)
+        self.assertEqual(sys.getrefcount(arg), old_refcount)
+
+    def test_custom_key(self):
+        """Accepts an alternative fingerprint function"""
+
+        @memoize(key=CityHash64)
+        def func(data):
+            return data
+
+        func(b"abc")
+        func(b"abc")
+        self.assertEqual(func.cache_info().hits, 1)
+
+    def test_cache_class(self):
+        """Cache class can wrap a function directly"""
+        func = FingerprintCache(len, maxsize=4)
+        self.assertEqual(func(b"abc"), 3)
+        self.assertEqual(func(b"abc"), 3)
+        self.assertEqual(func.cache_info()[:4], (1, 1, 4, 1))
+
+    def test_wraps_function(self):
+        """Preserves wrapped function metadata"""
+
+        @memoize()
+        def func(data):
+            """docstring"""
+            return data
+
+        self.assertEqual(func.__name__, "func")
+        self.assertEqual(func.__doc__, "docstring")
+
+    def test_method(self):
+        """Methods are keyed by instance without keeping it alive"""
+
+        class Klass(object):
+            """dummy class"""
+
+            def __init__(self, factor):
+                self.factor = factor
+
+            @memoize()
+            def method(self, data):
+                """dummy method"""
+                return len(data) * self.factor
+
+        obj1, obj2 = Klass(1), Klass(2)
+        self.assertEqual(obj1.method(b"abc"), 3)
+        self.assertEqual(obj1.method(b"abc"), 3)
+        self.assertEqual(obj2.method(b"abc"), 6)
+        self.assertEqual(obj1.method.cache_info()[:4], (1, 2, 128, 2))
+
+        obj_ref = weakref.ref(obj1)
+        del obj1
+        gc.collect()
+        self.assertIsNone(obj_ref())
+        self.assertEqual(obj2.method.cache_info().currsize, 1)
+
+        obj2.method.cache_clear()
+        self.assertEqual(Klass.method.cache_info().currsize, 0)
+
+    def test_method_keyword_self(self):
+        """Wrapped functions may take a keyword argument named self"""
+
+        class Klass(object):
+            """dummy class"""
+
+            @memoize()
+            def method(self, data):
+                """dummy method"""
+                return len(data)
+
+        obj = Klass()
+        self.assertEqual(Klass.method(self=obj, data=b"abc"), 3)
+        self.assertEqual(Klass.method(self=obj, data=b"abc"), 3)
+        self.assertEqual(Klass.method.cache_info()[:2], (1, 1))
+
+    def test_method_slots(self):
+        """Instances without weak reference support are kept while cached"""
+
+        class Slotted(object):
+            """class without __weakref__"""
+
+            __slots__ = ["factor"]
+
+            def __init__(self, factor):
+                self.factor = factor
+
+            @memoize(maxsize=1)
+            def method(self, data):
+                """dummy method"""
+                return len(data) * self.factor
+
+        obj = Slotted(2)
+        self.assertEqual(obj.method(b"abc"), 6)
+        self.assertEqual(obj.method(b"abc"), 6)
+        self.assertEqual(Slotted(3).method(b"abc"), 9)
+        self.assertEqual(Slotted.method.cache_info()[:4], (1, 2, 1, 1))
+
+    def test_method_unhashable(self):
+        """Instances are keyed by identity, so they need not be hashable"""
+
+        class Klass(object):
+            """class with __eq__ but no __hash__"""
+
+            def __init__(self, factor):
+                self.factor = factor
+
+            def __eq__(self, other):
+                return True
+
+            @memoize()
+            def method(self, data):
+                """dummy method"""
+                return len(data) * self.factor
+
+        self.assertEqual(Klass(1).method(b"abc"), 3)
+        self.assertEqual(Klass(2).method(b"abc"), 6)
+
+    def test_classmethod(self):
+        """Classes are keyed by identity under a stacked classmethod"""
+
+        class Base(object):
+            """dummy class"""
+
+            factor = 1
+
+            @classmethod
+            @memoize()
+            def method(cls, data):
+                """dummy method"""
+                return len(data) * cls.factor
+
+        class Derived(Base):
+            """dummy subclass"""
+
+            factor = 2
+
+        self.assertEqual(Base.method(b"abc"), 3)
+        self.assertEqual(Derived.method(b"abc"), 6)
+        self.assertEqual(Base().method(b"abc"), 3)
+        self.assertEqual(Base.method.cache_info()[:2], (1, 2))
+
+    def test_method_no_reference_cycles(self):
+        """Method entries are released without the cyclic collector"""
+
+        class Klass(object):
+            """dummy class"""
+
+            @memoize(maxsize=1)
+            def method(self, data):
+                """dummy method"""
+                return len(data)
+
+        gc.collect()
+        gc.disable()
+        try:
+            obj1, obj2 = Klass(), Klass()
+            obj1.method(b"a")
+            obj2.method(b"a")
+            obj1.method(b"b")
+            obj2.method.cache_clear()
+            obj2.method(b"c")
+            del obj1, obj2
+            self.assertEqual(Klass.method.cache_info().currsize, 0)
+            self.assertEqual(gc.collect(), 0)
+        finally:
+            gc.enable()
+
+    def test_non_contiguous_buffer(self):
+        """Buffer error names the argument that cannot be fingerprinted"""
+
+        @memoize()
+        def func(data):
+            return data
+
+        view = memoryview(array.array("b", range(10)))[::2]
+        with self.assertRaisesRegex(BufferError, "position 0"):
+            func(view)
+
+    def test_unsupported_argument(self):
+        """Type error names the argument that cannot be fingerprinted"""
+
+        @memoize()
+        def func(data, extra=None):
+            return data
+
+        with self.assertRaisesRegex(TypeError, "position 0.*'list'"):
+            func([])
+        with self.assertRaisesRegex(TypeError, "'extra'.*'dict'"):
+            func(b"a", extra={})
+
+    def test_bad_limits(self):
+        """Raises on invalid maxsize or maxbytes"""
+        for argname in ["maxsize", "maxbytes"]:
+            with self.assertRaises(TypeError):
+                memoize(**{argname: "a"})
+            with self.assertRaises(ValueError):
+                memoize(**{argname: -1})
+
+    def test_readme_example(self):
+        """Example from README"""
+        from farmhash import Fingerprint128
+
+        @memoize(maxsize=1024, key=Fingerprint128)
+        def count_zeros(payload, start=0):
+            return payload.count(0, start)
+
+        self.assertEqual(count_zeros(b"\x00" * 100000), 100000)
+        self.assertEqual(count_zeros(b"\x00" * 100000), 100000)
+        self.assertEqual(count_zeros(bytearray(100000), start=10), 99990)
+        self.assertEqual(count_zeros.cache_info()[:4], (1, 2, 1024, 2))